@@ -71,22 +71,22 @@ class ObjectRegistry:
         {"object_type": "study", "edsl_class": Study},
     ]
     object_type_to_edsl_class = {o["object_type"]: o["edsl_class"] for o in objects}
-    edsl_class_to_object_type = {
-        o["edsl_class"].__name__: o["object_type"] for o in objects
-    }
+    edsl_class_to_object_type = {o["edsl_class"]: o["object_type"] for o in objects}
 
     @classmethod
     def get_object_type_by_edsl_class(cls, edsl_object: EDSLObject) -> ObjectType:
-        if isinstance(edsl_object, type):
-            edsl_class_name = edsl_object.__name__
-        else:
-            edsl_class_name = type(edsl_object).__name__
-        if edsl_class_name.startswith("Question"):
-            edsl_class_name = "QuestionBase"
-        object_type = cls.edsl_class_to_object_type.get(edsl_class_name)
-        if object_type is None:
-            raise ValueError(f"Object type not found for {edsl_object=}")
-        return object_type
+        """
+        Return the object type of an EDSL object or class.
+
+        The lookup walks the MRO, so subclasses (e.g., specific question types)
+        resolve to the object type of their registered base class.
+        """
+        edsl_class = edsl_object if isinstance(edsl_object, type) else type(edsl_object)
+        for klass in edsl_class.__mro__:
+            object_type = cls.edsl_class_to_object_type.get(klass)
+            if object_type is not None:
+                return object_type
+        raise ValueError(f"Object type not found for {edsl_object=}")
 
     @classmethod
     def get_edsl_class_by_object_type(cls, object_type: ObjectType) -> EDSLObject:
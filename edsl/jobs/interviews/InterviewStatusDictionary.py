@@ -33,6 +33,22 @@ class InterviewStatusDictionary(UserDict):
             new_dict[key] = self[key] + other[key]
         return InterviewStatusDictionary(new_dict)
 
+    def __iadd__(
+        self, other: "InterviewStatusDictionary"
+    ) -> "InterviewStatusDictionary":
+        """Adds another InterviewStatusDictionary to this one in place.
+
+        >>> d = InterviewStatusDictionary()
+        >>> d += InterviewStatusDictionary({**{s: 1 for s in TaskStatus}, "number_from_cache": 2})
+        >>> d[TaskStatus.SUCCESS], d["number_from_cache"]
+        (1, 2)
+        """
+        if not isinstance(other, InterviewStatusDictionary):
+            raise ValueError(f"Can't add {type(other)} to InterviewStatusDictionary")
+        for key, value in other.data.items():
+            self.data[key] += value
+        return self
+
     @property
     def waiting(self) -> int:
         """Return the number of tasks that are in a waiting status of some kind."""
@@ -132,34 +132,26 @@ class JobsRunnerAsyncio(JobsRunnerStatusMixin):
         )
 
         # we should have a valid result for each question
-        answer_key_names = {k for k in set(answer.keys()) if not k.endswith("_comment")}
+        answer_key_names = {k for k in answer if not k.endswith("_comment")}
 
         assert len(valid_results) == len(answer_key_names)
 
         # TODO: move this down into Interview
-        question_name_to_prompts = dict({})
-        for result in valid_results:
-            question_name = result["question_name"]
-            question_name_to_prompts[question_name] = {
-                "user_prompt": result["prompts"]["user_prompt"],
-                "system_prompt": result["prompts"]["system_prompt"],
-            }
-
         prompt_dictionary = {}
-        for answer_key_name in answer_key_names:
-            prompt_dictionary[
-                answer_key_name + "_user_prompt"
-            ] = question_name_to_prompts[answer_key_name]["user_prompt"]
-            prompt_dictionary[
-                answer_key_name + "_system_prompt"
-            ] = question_name_to_prompts[answer_key_name]["system_prompt"]
-
         raw_model_results_dictionary = {}
         for result in valid_results:
             question_name = result["question_name"]
-            raw_model_results_dictionary[
-                question_name + "_raw_model_response"
-            ] = result["raw_model_response"]
+            if question_name in answer_key_names:
+                prompts = result["prompts"]
+                prompt_dictionary[question_name + "_user_prompt"] = prompts[
+                    "user_prompt"
+                ]
+                prompt_dictionary[question_name + "_system_prompt"] = prompts[
+                    "system_prompt"
+                ]
+            raw_model_results_dictionary[question_name + "_raw_model_response"] = (
+                result["raw_model_response"]
+            )
 
         from edsl.results.Result import Result
 
@@ -51,14 +51,17 @@ class JobsRunnerStatusData:
         1
         """
         model_to_status = defaultdict(InterviewStatusDictionary)
+        # Models hash by serializing themselves, so look up each distinct
+        # model object's status dictionary once rather than once per interview.
+        status_by_model_id = {}
 
         for interview in interviews:
             model = interview.model  # get the model for the interview
-            model_to_status[
-                model
-            ] += (
-                interview.interview_status
-            )  # InterviewStatusDictionary objects can be added together
+            status = status_by_model_id.get(id(model))
+            if status is None:
+                status = status_by_model_id[id(model)] = model_to_status[model]
+            # InterviewStatusDictionary objects can be added together in place
+            status += interview.interview_status
 
         return (
             model_to_status.values()
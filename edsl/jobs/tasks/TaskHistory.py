@@ -32,18 +32,22 @@ class TaskHistory:
 
     def to_dict(self):
         """Return the TaskHistory as a dictionary."""
-        return {
-            "exceptions": [
-                e.to_dict(include_traceback=self.include_traceback)
-                for e in self.exceptions
-            ],
-            "indices": self.indices,
-        }
+        exceptions = []
+        indices = []
+        for index, interview in self._interviews.items():
+            if interview.exceptions != {}:
+                exceptions.append(
+                    interview.exceptions.to_dict(
+                        include_traceback=self.include_traceback
+                    )
+                )
+                indices.append(index)
+        return {"exceptions": exceptions, "indices": indices}
 
     @property
     def has_exceptions(self) -> bool:
         """Return True if there are any exceptions."""
-        return len(self.exceptions) > 0
+        return any(i.exceptions != {} for i in self._interviews.values())
 
     def _repr_html_(self):
         """Return an HTML representation of the TaskHistory."""
@@ -119,8 +123,19 @@ class TaskHistory:
 
     def plot(self, num_periods=100, get_embedded_html=False):
         """Plot the number of tasks in each state over time."""
+        import numpy as np
+
         new_counts = self.plotting_data(num_periods)
-        max_count = max([max(entry.values()) for entry in new_counts])
+
+        # Stage the per-period counts into a (status x period) array once,
+        # rather than re-reading every period's dict for each subplot.
+        statuses = list(TaskStatus)
+        counts = np.array(
+            [[entry.get(status, 0) for status in statuses] for entry in new_counts],
+            dtype=np.int64,
+        ).T
+        max_count = counts.max()
+        x = np.arange(len(new_counts))
 
         rows = int(len(TaskStatus) ** 0.5) + 1
         cols = (len(TaskStatus) + rows - 1) // rows  # Ensure all plots fit
@@ -130,13 +145,9 @@ class TaskHistory:
         fig, axes = plt.subplots(rows, cols, figsize=(15, 10))
         axes = axes.flatten()  # Flatten in case of a single row/column
 
-        for i, status in enumerate(TaskStatus):
+        for i, status in enumerate(statuses):
             ax = axes[i]
-            x = range(len(new_counts))
-            y = [
-                item.get(status, 0) for item in new_counts
-            ]  # Use .get() to handle missing keys safely
-            ax.plot(x, y, marker="o", linestyle="-")
+            ax.plot(x, counts[i], marker="o", linestyle="-")
             ax.set_title(status.name)
             ax.set_xlabel("Time Periods")
             ax.set_ylabel("Count")
@@ -17,8 +17,8 @@ from edsl.utilities.decorators import add_edsl_version, remove_edsl_version
 
 from edsl.language_models.repair import repair
 from edsl.enums import InferenceServiceType
-from edsl.Base import RichPrintingMixin, PersistenceMixin
-from edsl.enums import service_to_api_keyname
+from edsl.Base import RichPrintingMixin, PersistenceMixin, _json_loads
+from edsl.enums import service_to_api_keyname, get_token_pricing
 from edsl.exceptions import MissingAPIKeyError
 from edsl.language_models.RegisterLanguageModelsMeta import RegisterLanguageModelsMeta
 
@@ -75,6 +75,7 @@ class LanguageModel(
     def __init__(self, **kwargs):
         """Initialize the LanguageModel."""
         self.model = getattr(self, "_model_", None)
+        self._token_pricing = get_token_pricing(self.model)
         default_parameters = getattr(self, "_parameters_", None)
         parameters = self._overide_default_parameters(kwargs, default_parameters)
         self.parameters = parameters
@@ -325,7 +326,7 @@ class LanguageModel(
 
         cached_response, cache_key = cache.fetch(**cache_call_params)
         if cached_response:
-            response = json.loads(cached_response)
+            response = _json_loads(cached_response)
             cache_used = True
         else:
             remote_call = hasattr(self, "remote") and self.remote
@@ -398,7 +399,7 @@ class LanguageModel(
         response = self.parse_response(raw_response)
 
         try:
-            dict_response = json.loads(response)
+            dict_response = _json_loads(response)
         except json.JSONDecodeError as e:
             # TODO: Turn into logs to generate issues
             dict_response, success = await repair(
@@ -422,8 +423,20 @@ class LanguageModel(
     get_response = sync_wrapper(async_get_response)
 
     def cost(self, raw_response: dict[str, Any]) -> float:
-        """Return the dollar cost of a raw response."""
-        raise NotImplementedError
+        """Return the dollar cost of a raw response.
+
+        The model's token prices are resolved once, when the model is created.
+
+        >>> m = LanguageModel.example()
+        >>> round(m.cost({"usage": {"prompt_tokens": 1000, "completion_tokens": 1000}}), 5)
+        0.04
+        """
+        usage = raw_response.get("usage", {})
+        prices = self._token_pricing
+        return (
+            usage.get("prompt_tokens", 0) * prices.prompt_token_price
+            + usage.get("completion_tokens", 0) * prices.completion_token_price
+        )
 
     #######################
     # SERIALIZATION METHODS
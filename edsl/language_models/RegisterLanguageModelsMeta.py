@@ -10,6 +10,7 @@ class RegisterLanguageModelsMeta(ABCMeta):
     """Metaclass to register output elements in a registry i.e., those that have a parent."""
 
     _registry = {}  # Initialize the registry as a dictionary
+    _model_names_to_classes = None  # Cache; reset whenever a class is registered
     REQUIRED_CLASS_ATTRIBUTES = ["_model_", "_parameters_", "_inference_service_"]
 
     def __init__(cls, name, bases, dct):
@@ -55,6 +56,7 @@ class RegisterLanguageModelsMeta(ABCMeta):
                 must_be_async=False,
             )
             RegisterLanguageModelsMeta._registry[model_name] = cls
+            RegisterLanguageModelsMeta._model_names_to_classes = None
 
     @classmethod
     def get_registered_classes(cls):
@@ -187,7 +189,16 @@ class RegisterLanguageModelsMeta(ABCMeta):
 
     @classmethod
     def model_names_to_classes(cls):
-        """Return a dictionary of model names to classes."""
+        """Return a dictionary of model names to classes.
+
+        The dictionary is built once and reused until a new class is registered.
+
+        >>> d = RegisterLanguageModelsMeta.model_names_to_classes()
+        >>> d is RegisterLanguageModelsMeta.model_names_to_classes()
+        True
+        """
+        if RegisterLanguageModelsMeta._model_names_to_classes is not None:
+            return RegisterLanguageModelsMeta._model_names_to_classes
         d = {}
         for classname, cls in cls._registry.items():
             if hasattr(cls, "_model_"):
@@ -196,4 +207,5 @@ class RegisterLanguageModelsMeta(ABCMeta):
                 raise Exception(
                     f"Class {classname} does not have a _model_ class attribute."
                 )
+        RegisterLanguageModelsMeta._model_names_to_classes = d
         return d
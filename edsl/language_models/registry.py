@@ -1,12 +1,19 @@
 import textwrap
 
+# Model classes built from the default registry, keyed by model name.
+# Building a class is expensive (the metaclass inspects every method), and
+# deserializing a Results object would otherwise rebuild one per Result.
+_model_class_cache = {}
+
 
 def get_model_class(model_name, registry=None):
     from edsl.inference_services.registry import default
 
-    registry = registry or default
-    factory = registry.create_model_factory(model_name)
-    return factory
+    if registry is not None and registry is not default:
+        return registry.create_model_factory(model_name)
+    if model_name not in _model_class_cache:
+        _model_class_cache[model_name] = default.create_model_factory(model_name)
+    return _model_class_cache[model_name]
 
 
 class Meta(type):
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Optional
 from abc import ABC
 from typing import Any, List
@@ -12,6 +13,15 @@ class PreserveUndefined(Undefined):
         return "{{ " + self._undefined_name + " }}"
 
 
+_render_env = Environment(undefined=PreserveUndefined)
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(text: str) -> Template:
+    """Compile template text once; the same instructions are rendered for every interview."""
+    return _render_env.from_string(text)
+
+
 from edsl.exceptions.prompts import TemplateRenderError
 from edsl.prompts.prompt_config import (
     C2A,
@@ -229,11 +239,13 @@ class PromptBase(
         >>> p.render({"name": "John", "age": 44}, codebook=codebook)
         Prompt(text=\"""You are an agent named John. Age: 44\""")
         """
-        env = Environment(undefined=PreserveUndefined)
         try:
             previous_text = None
+            # only the source text is cached; the re-render passes see text
+            # that is specific to this agent and scenario
+            template = _compile_template(text)
             for _ in range(MAX_NESTING):
-                rendered_text = env.from_string(text).render(
+                rendered_text = template.render(
                     primary_replacement, **additional_replacements
                 )
                 if rendered_text == previous_text:
@@ -241,6 +253,7 @@ class PromptBase(
                     return rendered_text
                 previous_text = text
                 text = rendered_text
+                template = _render_env.from_string(text)
 
             # If the loop exits without returning, it indicates too much nesting
             raise TemplateRenderError(
@@ -1,11 +1,61 @@
 """Mixin with validators for LLM answers to questions."""
 
+import math
 import re
-from typing import Any, Type, Union
+from functools import cached_property, wraps
+from typing import Any, Callable, Optional, Type, Union
 from edsl.exceptions import (
     QuestionAnswerValidationError,
 )
 
+# Matches the numbers embedded in a string answer, e.g. "about 3.5 hours".
+_NUMERIC_RE = re.compile(r"[-+]?\d*\.\d+|\d+")
+# Characters dropped from string answers before converting them to numbers.
+_STRIP_TABLE = str.maketrans("", "", ", $%\t\n")
+
+# Upper bound on the number of accepted answer values remembered per question.
+MAX_MEMOIZED_ANSWERS = 1000
+
+
+def memoize_valid_answers(validate_answer: Callable) -> Callable:
+    """Skip re-validating answer values that a question has already accepted.
+
+    Accepted values are remembered on the question instance, keyed by the type
+    and value of `answer["answer"]`; setting any question attribute clears them.
+    Unhashable answer values (e.g., lists) are always validated.
+
+    >>> class Q(AnswerValidatorMixin):
+    ...     calls = 0
+    ...     @memoize_valid_answers
+    ...     def _validate_answer(self, answer):
+    ...         Q.calls += 1
+    ...         self._validate_answer_template_basic(answer)
+    ...         return answer
+    >>> q = Q()
+    >>> _ = q._validate_answer({"answer": 1}); _ = q._validate_answer({"answer": 1})
+    >>> Q.calls
+    1
+    """
+
+    @wraps(validate_answer)
+    def wrapper(self, answer):
+        try:
+            value = answer["answer"]
+            key = (type(value), value)
+            hash(key)
+        except (TypeError, KeyError):
+            return validate_answer(self, answer)
+        validated_answers = self.__dict__.setdefault("_validated_answers", {})
+        if key in validated_answers:
+            answer["answer"] = validated_answers[key]
+            return answer
+        answer = validate_answer(self, answer)
+        if len(validated_answers) < MAX_MEMOIZED_ANSWERS:
+            validated_answers[key] = answer["answer"]
+        return answer
+
+    return wrapper
+
 
 class AnswerValidatorMixin:
     """
@@ -16,6 +66,24 @@ class AnswerValidatorMixin:
     - Question specific validation: validators for specific question types
     """
 
+    # Defaults for optional attributes read by the validators; question types
+    # that support them override these.
+    allow_nonresponse: bool = True
+    max_list_items: Optional[int] = None
+
+    @cached_property
+    def _acceptable_answer_codes(self) -> frozenset:
+        """Return the answer codes that index into `question_options`.
+
+        The value is cached on the instance; setting `question_options` resets it.
+
+        >>> avm = AnswerValidatorMixin()
+        >>> avm.question_options = ["a", "b", "c"]
+        >>> sorted(avm._acceptable_answer_codes)
+        [0, 1, 2]
+        """
+        return frozenset(range(len(self.question_options)))
+
     #####################
     # TEMPLATE VALIDATION
     #####################
@@ -40,6 +108,37 @@ class AnswerValidatorMixin:
                 f"Answer must have an 'answer' key (got {answer})."
             )
 
+    def _validate_answer_dict_with_key(
+        self, answer: Any, key: str, of_type: Type
+    ) -> None:
+        """Check that the answer is a dictionary whose `key` value is of the specified type.
+
+        Equivalent to `_validate_answer_template_basic` followed by
+        `_validate_answer_key_value`, with a single lookup of the key.
+
+        >>> avm = AnswerValidatorMixin()
+        >>> avm._validate_answer_dict_with_key({'answer': [1]}, 'answer', list)
+        >>> avm._validate_answer_dict_with_key({'comment': 'hi'}, 'answer', list)
+        Traceback (most recent call last):
+        ...
+        edsl.exceptions.questions.QuestionAnswerValidationError: Answer must have an 'answer' key (got {'comment': 'hi'}).
+        """
+        if not isinstance(answer, dict):
+            raise QuestionAnswerValidationError(
+                f"Answer must be a dictionary (got {answer})."
+            )
+        try:
+            value = answer[key]
+        except KeyError:
+            raise QuestionAnswerValidationError(
+                f"Answer must have an '{key}' key (got {answer})."
+            )
+        if not isinstance(value, of_type):
+            raise QuestionAnswerValidationError(
+                f"""Answer key '{key}' must be of type {of_type.__name__};
+                (got {value}) which is of type {type(value)}."""
+            )
+
     #####################
     # VALUE VALIDATION
     #####################
@@ -58,30 +157,64 @@ class AnswerValidatorMixin:
     ) -> None:
         """Check that the value of a key is numeric (int or float).
 
+        Numeric strings are converted in place, so later validators can use
+        `answer[key]` as a number.
+
         >>> avm = AnswerValidatorMixin()
         >>> avm._validate_answer_key_value_numeric({'answer': 1}, 'answer')
+        >>> answer = {'answer': '1,000.5'}
+        >>> avm._validate_answer_key_value_numeric(answer, 'answer')
+        >>> answer
+        {'answer': 1000.5}
+        >>> avm._validate_answer_key_value_numeric({'answer': 'about 12 years'}, 'answer')
+        >>> answer = {'answer': ' $1,250 '}
+        >>> avm._validate_answer_key_value_numeric(answer, 'answer')
+        >>> answer
+        {'answer': 1250}
+        >>> avm._validate_answer_key_value_numeric({'answer': '1' * 400}, 'answer')
         >>> avm._validate_answer_key_value_numeric({'answer': 'poo'}, 'answer')
         Traceback (most recent call last):
         ...
         edsl.exceptions.questions.QuestionAnswerValidationError: Answer should be numerical (int or float). Got 'poo'
+        >>> avm._validate_answer_key_value_numeric({'answer': 'nan'}, 'answer')
+        Traceback (most recent call last):
+        ...
+        edsl.exceptions.questions.QuestionAnswerValidationError: Answer should be numerical (int or float). Got 'nan'
+        >>> avm._validate_answer_key_value_numeric({'answer': True}, 'answer')
+        Traceback (most recent call last):
+        ...
+        edsl.exceptions.questions.QuestionAnswerValidationError: Answer should be numerical (int or float).
         """
         value = answer.get(key)
+        # bools are ints, but not valid numerical answers
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return None
         initial_value = value
-        if type(value) == str:
-            value = value.replace(",", "")
-            value = "".join(re.findall(r"[-+]?\d*\.\d+|\d+", value))
-            if value.isdigit():
+        if isinstance(value, str):
+            value = value.translate(_STRIP_TABLE)
+            # Most answers are already clean numerals, so try converting them
+            # directly and only extract the digits with the regex if that fails.
+            try:
                 value = int(value)
-            else:
+            except ValueError:
                 try:
-                    float(value)
                     value = float(value)
                 except ValueError:
-                    raise QuestionAnswerValidationError(
-                        f"Answer should be numerical (int or float). Got '{initial_value}'"
-                    )
-            return None
-        elif type(value) == int or type(value) == float:
+                    pass
+            if isinstance(value, str) or (
+                isinstance(value, float) and not math.isfinite(value)
+            ):
+                value = "".join(_NUMERIC_RE.findall(str(value)))
+                if value.isdigit():
+                    value = int(value)
+                else:
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        raise QuestionAnswerValidationError(
+                            f"Answer should be numerical (int or float). Got '{initial_value}'"
+                        )
+            answer[key] = value
             return None
         else:
             raise QuestionAnswerValidationError(
@@ -96,29 +229,39 @@ class AnswerValidatorMixin:
 
         Check that answer["answer"]:
         - has keys that are in the range of the number of options
+        - has values that are numbers
         - has values that are non-negative integers
         - has values that sum to `budget_sum`
         - contains all keys in the range of the number of options
         """
+        import numpy as np
+
         answer = answer.get("answer")
         budget_sum = self.budget_sum
-        acceptable_answer_keys = set(range(len(self.question_options)))
-        answer_keys = set([int(k) for k in answer.keys()])
-        current_sum = sum(answer.values())
-        if not current_sum == budget_sum:
+        acceptable_answer_keys = self._acceptable_answer_codes
+        answer_keys = set(map(int, answer.keys()))
+        try:
+            values = np.asarray(list(answer.values()))
+        except ValueError:
+            values = None
+        if values is None or values.dtype.kind not in "biuf":
+            raise QuestionAnswerValidationError(
+                f"Budget values must be numbers, but got {list(answer.values())}."
+            )
+        if not values.sum() == budget_sum:
             raise QuestionAnswerValidationError(
-                f"Budget sum must be {budget_sum}, but got {current_sum}."
+                f"Budget sum must be {budget_sum}, but got {sum(answer.values())}."
             )
-        if any(v < 0 for v in answer.values()):
+        if (values < 0).any():
             raise QuestionAnswerValidationError(
                 f"Budget values must be positive, but got {answer_keys}."
             )
-        if any([int(key) not in acceptable_answer_keys for key in answer.keys()]):
+        if not answer_keys <= acceptable_answer_keys:
             raise QuestionAnswerValidationError(
-                f"Budget keys must be in {acceptable_answer_keys}, but got {answer_keys}."
+                f"Budget keys must be in {set(acceptable_answer_keys)}, but got {answer_keys}."
             )
         if acceptable_answer_keys != answer_keys:
-            missing_keys = acceptable_answer_keys - answer_keys
+            missing_keys = set(acceptable_answer_keys - answer_keys)
             raise QuestionAnswerValidationError(
                 f"All but keys must be represented in the answer. Missing: {missing_keys}."
             )
@@ -133,6 +276,10 @@ class AnswerValidatorMixin:
         >>> avm.min_selections = 1
         >>> avm.max_selections = 2
         >>> avm._validate_answer_checkbox({"answer": ["0", "1"]})
+        >>> avm._validate_answer_checkbox({"answer": ["0", "3"]})
+        Traceback (most recent call last):
+        ...
+        edsl.exceptions.questions.QuestionAnswerValidationError: Answer codes [3] are not in [0, 1, 2].
         >>> avm._validate_answer_checkbox({"answer": []})
         Traceback (most recent call last):
         ...
@@ -144,19 +291,18 @@ class AnswerValidatorMixin:
         - has at least `min_selections` elements, if provided
         - has at most `max_selections` elements, if provided
         """
-        answer_codes = answer["answer"]
         try:
-            answer_codes = [int(k) for k in answer["answer"]]
+            answer_codes = list(map(int, answer["answer"]))
         except:
             raise QuestionAnswerValidationError(
                 f"Answer codes must be a list of strings, bytes-like objects or real numbers (got {answer['answer']})."
             )
-        acceptable_values = list(range(len(self.question_options)))
-        for answer_code in answer_codes:
-            if answer_code not in acceptable_values:
-                raise QuestionAnswerValidationError(
-                    f"Answer code {answer_code} has elements not in {acceptable_values}."
-                )
+        invalid_codes = set(answer_codes) - self._acceptable_answer_codes
+        if invalid_codes:
+            # the sorted code lists are only built for the error message
+            raise QuestionAnswerValidationError(
+                f"Answer codes {sorted(invalid_codes)} are not in {sorted(self._acceptable_answer_codes)}."
+            )
         if self.min_selections is not None and len(answer_codes) < self.min_selections:
             raise QuestionAnswerValidationError(
                 f"Answer codes, {answer_codes}, has fewer than {self.min_selections} options selected."
@@ -174,15 +320,17 @@ class AnswerValidatorMixin:
         - has all keys that are in the answer template
         """
         value = answer.get("answer")
-        acceptable_answer_keys = set(self.answer_template.keys())
-        if any([key not in acceptable_answer_keys for key in value.keys()]):
-            raise QuestionAnswerValidationError(
-                f"Answer keys must be in {acceptable_answer_keys}, but got {value.keys()}."
-            )
-        if any([key not in value.keys() for key in acceptable_answer_keys]):
+        acceptable_answer_keys = self.answer_template.keys()
+        # dict key views compare as sets, so matching keys take a single check
+        if value.keys() == acceptable_answer_keys:
+            return None
+        if value.keys() - acceptable_answer_keys:
             raise QuestionAnswerValidationError(
-                f"Answer must have all keys in {acceptable_answer_keys}, but got {value.keys()}."
+                f"Answer keys must be in {set(acceptable_answer_keys)}, but got {value.keys()}."
             )
+        raise QuestionAnswerValidationError(
+            f"Answer must have all keys in {set(acceptable_answer_keys)}, but got {value.keys()}."
+        )
 
     def _validate_answer_list(self, answer: dict[str, Union[list, str]]) -> None:
         """Validate QuestionList-specific answer.
@@ -193,18 +341,10 @@ class AnswerValidatorMixin:
         - has no empty strings
         """
         value = answer.get("answer")
-        if (
-            hasattr(self, "allow_nonresponse")
-            and self.allow_nonresponse == False
-            and (value == [] or value is None)
-        ):
+        if not self.allow_nonresponse and (value == [] or value is None):
             raise QuestionAnswerValidationError("You must provide a response.")
 
-        if (
-            hasattr(self, "max_list_items")
-            and self.max_list_items is not None
-            and (len(value) > self.max_list_items)
-        ):
+        if self.max_list_items is not None and len(value) > self.max_list_items:
             raise QuestionAnswerValidationError("Response has too many items.")
 
         if any([item == "" for item in value]):
@@ -219,7 +359,7 @@ class AnswerValidatorMixin:
         - is not less than `min_value`
         - is not greater than `max_value`
         """
-        value = float(answer.get("answer"))
+        value = answer["answer"]
         if self.min_value is not None and value < self.min_value:
             raise QuestionAnswerValidationError(
                 f"Value {value} is less than {self.min_value}"
@@ -250,7 +390,7 @@ class AnswerValidatorMixin:
             raise QuestionAnswerValidationError(
                 f"Answer code must be a non-negative integer (got {value})."
             )
-        if int(value) not in range(len(self.question_options)):
+        if value not in self._acceptable_answer_codes:
             raise QuestionAnswerValidationError(
                 f"Answer code {value} must be in {list(range(len(self.question_options)))}."
             )
@@ -264,7 +404,7 @@ class AnswerValidatorMixin:
         - has the correct number of elements
         """
         value = answer.get("answer")
-        acceptable_values = list(range(len(self.question_options)))
+        acceptable_values = self._acceptable_answer_codes
         for v in value:
             try:
                 answer_code = int(v)
@@ -278,7 +418,7 @@ class AnswerValidatorMixin:
                 )
             if answer_code not in acceptable_values:
                 raise QuestionAnswerValidationError(
-                    f"Answer {value} has elements not in {acceptable_values}, namely {v}."
+                    f"Answer {value} has elements not in {sorted(acceptable_values)}, namely {v}."
                 )
         if len(value) != self.num_selections:
             raise QuestionAnswerValidationError(
@@ -1,6 +1,7 @@
 """This module contains the Question class, which is the base class for all questions in EDSL."""
 
 from __future__ import annotations
+import sys
 import time
 from abc import ABC, abstractmethod
 from typing import Any, Type, Optional, List, Callable
@@ -35,6 +36,10 @@ class QuestionBase(
     question_name: str = QuestionNameDescriptor()
     question_text: str = QuestionTextDescriptor()
 
+    # Values cached on the instance that are derived from other attributes;
+    # they are not part of the question's data.
+    _derived_attributes = ("_acceptable_answer_codes", "_validated_answers")
+
     def __getitem__(self, key: str) -> Any:
         """Get an attribute of the question."""
         return getattr(self, key)
@@ -92,7 +97,7 @@ class QuestionBase(
         candidate_data = {
             k.replace("_", "", 1): v
             for k, v in self.__dict__.items()
-            if k.startswith("_")
+            if k.startswith("_") and k not in self._derived_attributes
         }
         optional_attributes = {
             "set_instructions": "instructions",
@@ -259,7 +264,9 @@ class QuestionBase(
         local_data = data.copy()
 
         try:
-            question_type = local_data.pop("question_type")
+            # question types are used as registry keys; interning the
+            # deserialized value lets lookups match the class constants by identity
+            question_type = sys.intern(local_data.pop("question_type"))
             if question_type == "linear_scale":
                 # This is a fix for issue https://github.com/expectedparrot/edsl/issues/165
                 options_labels = local_data.get("option_labels", None)
@@ -373,6 +380,13 @@ class QuestionBase(
         """Validate the answer from the LLM. Behavior depends on the question type."""
         pass
 
+    def _validate_answers(self, answers: list[dict[str, Any]]) -> list[dict]:
+        """Validate a batch of answers from the LLM, raising on the first invalid one.
+
+        Question types can override this to check the whole batch at once.
+        """
+        return [self._validate_answer(answer) for answer in answers]
+
     def _validate_response(self, response):
         """Validate the response from the LLM. Behavior depends on the question type."""
         if "answer" not in response:
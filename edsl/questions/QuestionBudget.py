@@ -37,8 +37,7 @@ class QuestionBudget(QuestionBase):
     ################
     def _validate_answer(self, answer: dict[str, Any]) -> dict[str, Union[int, str]]:
         """Validate the answer."""
-        self._validate_answer_template_basic(answer)
-        self._validate_answer_key_value(answer, "answer", dict)
+        self._validate_answer_dict_with_key(answer, "answer", dict)
         self._validate_answer_budget(answer)
         return answer
 
@@ -48,8 +48,7 @@ class QuestionCheckBox(QuestionBase):
     ################
     def _validate_answer(self, answer: Any) -> dict[str, Union[int, str]]:
         """Validate the answer."""
-        self._validate_answer_template_basic(answer)
-        self._validate_answer_key_value(answer, "answer", list)
+        self._validate_answer_dict_with_key(answer, "answer", list)
         self._validate_answer_checkbox(answer)
         return answer
 
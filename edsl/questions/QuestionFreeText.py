@@ -38,19 +38,28 @@ class QuestionFreeText(QuestionBase):
     ################
     def _validate_answer(self, answer: Any) -> dict[str, str]:
         """Validate the answer."""
-        self._validate_answer_template_basic(answer)
-        self._validate_answer_key_value(answer, "answer", str)
+        self._validate_answer_dict_with_key(answer, "answer", str)
         return answer
 
+    def _validate_answers(self, answers: list[Any]) -> list[dict[str, str]]:
+        """Validate a batch of answers, checking all of them in a single pass."""
+        if all(
+            isinstance(answer, dict) and isinstance(answer.get("answer"), str)
+            for answer in answers
+        ):
+            return answers
+        # fall back to answer-by-answer validation to raise the usual error
+        return super()._validate_answers(answers)
+
     def _translate_answer_code_to_answer(self, answer, scenario: "Scenario" = None):
         """Do nothing, because the answer is already in a human-readable format."""
         return answer
 
     def _simulate_answer(self, human_readable: bool = True) -> dict[str, str]:
         """Simulate a valid answer for debugging purposes."""
-        from edsl.utilities.utilities import random_string
+        from edsl.utilities.utilities import pooled_random_string
 
-        return {"answer": random_string()}
+        return {"answer": pooled_random_string()}
 
     @property
     def question_html_content(self) -> str:
@@ -1,14 +1,22 @@
 from __future__ import annotations
 import time
+from functools import lru_cache
 from typing import Union
 import random
 
 from jinja2 import Template
 
 from edsl.questions.QuestionBase import QuestionBase
+from edsl.questions.AnswerValidatorMixin import memoize_valid_answers
 from edsl.questions.descriptors import QuestionOptionsDescriptor
 
 
+@lru_cache(maxsize=1024)
+def _option_template(option: str) -> Template:
+    """Return the compiled Jinja template for an option, compiling it only once."""
+    return Template(option)
+
+
 class QuestionMultipleChoice(QuestionBase):
     """This question prompts the agent to select one option from a list of options."""
 
@@ -38,6 +46,7 @@ class QuestionMultipleChoice(QuestionBase):
     ################
     # Answer methods
     ################
+    @memoize_valid_answers
     def _validate_answer(
         self, answer: dict[str, Union[str, int]]
     ) -> dict[str, Union[str, int]]:
@@ -53,16 +62,14 @@ class QuestionMultipleChoice(QuestionBase):
         from edsl.scenarios.Scenario import Scenario
 
         scenario = scenario or Scenario()
-        translated_options = [
-            Template(str(option)).render(scenario) for option in self.question_options
-        ]
-        return translated_options[int(answer_code)]
+        option = self.question_options[int(answer_code)]
+        return _option_template(str(option)).render(scenario)
 
     def _simulate_answer(
         self, human_readable: bool = True
     ) -> dict[str, Union[int, str]]:
         """Simulate a valid answer for debugging purposes."""
-        from edsl.utilities.utilities import random_string
+        from edsl.utilities.utilities import pooled_random_string
 
         if human_readable:
             answer = random.choice(self.question_options)
@@ -70,7 +77,7 @@ class QuestionMultipleChoice(QuestionBase):
             answer = random.choice(range(len(self.question_options)))
         return {
             "answer": answer,
-            "comment": random_string(),
+            "comment": pooled_random_string(),
         }
 
     @property
@@ -5,6 +5,7 @@ from typing import Any, Optional, Union
 
 from edsl.exceptions import QuestionAnswerValidationError
 from edsl.questions.QuestionBase import QuestionBase
+from edsl.questions.AnswerValidatorMixin import memoize_valid_answers
 from edsl.questions.descriptors import NumericalOrNoneDescriptor
 
 
@@ -38,6 +39,7 @@ class QuestionNumerical(QuestionBase):
     ################
     # Answer methods
     ################
+    @memoize_valid_answers
     def _validate_answer(
         self, answer: dict[str, Any]
     ) -> dict[str, Union[str, float, int]]:
@@ -47,17 +49,47 @@ class QuestionNumerical(QuestionBase):
         self._validate_answer_numerical(answer)
         return answer
 
+    def _validate_answers(
+        self, answers: list[dict[str, Any]]
+    ) -> list[dict[str, Union[str, float, int]]]:
+        """Validate a batch of answers, checking their range in a single NumPy pass."""
+        import numpy as np
+
+        for answer in answers:
+            self._validate_answer_template_basic(answer)
+            self._validate_answer_key_value_numeric(answer, "answer")
+        try:
+            values = np.fromiter(
+                (answer["answer"] for answer in answers),
+                dtype=np.float64,
+                count=len(answers),
+            )
+        except OverflowError:
+            # ints too large for a float; compare them one by one instead
+            for answer in answers:
+                self._validate_answer_numerical(answer)
+            return answers
+        out_of_range = np.zeros(len(values), dtype=bool)
+        if self.min_value is not None:
+            out_of_range |= values < self.min_value
+        if self.max_value is not None:
+            out_of_range |= values > self.max_value
+        if out_of_range.any():
+            # raises the usual error for the first answer out of range
+            self._validate_answer_numerical(answers[int(out_of_range.argmax())])
+        return answers
+
     def _translate_answer_code_to_answer(self, answer, scenario: "Scenario" = None):
         """There is no answer code."""
         return answer
 
     def _simulate_answer(self, human_readable: bool = True):
         """Simulate a valid answer for debugging purposes."""
-        from edsl.utilities.utilities import random_string
+        from edsl.utilities.utilities import pooled_random_string
 
         return {
             "answer": uniform(self.min_value, self.max_value),
-            "comment": random_string(),
+            "comment": pooled_random_string(),
         }
 
     @property
@@ -44,8 +44,7 @@ class QuestionRank(QuestionBase):
     ################
     def _validate_answer(self, answer: Any) -> dict[str, list[int]]:
         """Validate the answer."""
-        self._validate_answer_template_basic(answer)
-        self._validate_answer_key_value(answer, "answer", list)
+        self._validate_answer_dict_with_key(answer, "answer", list)
         self._validate_answer_rank(answer)
         return answer
 
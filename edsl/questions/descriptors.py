@@ -1,6 +1,7 @@
 """This module contains the descriptors used to validate the attributes of the question classes."""
 
 from abc import ABC, abstractmethod
+import keyword
 import re
 from typing import Any, Callable
 from edsl.exceptions import (
@@ -57,6 +58,9 @@ class BaseDescriptor(ABC):
         from edsl.prompts.registry import get_classes
 
         instance.__dict__[self.name] = value
+        # values cached from the old attributes are now stale
+        for attribute in getattr(instance, "_derived_attributes", ()):
+            instance.__dict__.pop(attribute, None)
         if self.name == "_instructions":
             instructions = value
             if value is not None:
@@ -231,9 +235,9 @@ class QuestionNameDescriptor(BaseDescriptor):
 
     def validate(self, value, instance):
         """Validate the value is a valid variable name."""
-        from edsl.utilities.utilities import is_valid_variable_name
-
-        if not is_valid_variable_name(value):
+        # same check as `edsl.utilities.utilities.is_valid_variable_name`, inlined
+        # since it runs for every question that is created
+        if not (value.isidentifier() and not keyword.iskeyword(value)):
             raise QuestionCreationValidationError(
                 f"`question_name` is not a valid variable name (got {value})."
             )
@@ -259,60 +263,58 @@ class QuestionOptionsDescriptor(BaseDescriptor):
             raise QuestionCreationValidationError(
                 f"Question options must be a list (got {value})."
             )
-        if len(value) > Settings.MAX_NUM_OPTIONS:
+        num_options = len(value)
+        if num_options > Settings.MAX_NUM_OPTIONS:
             raise QuestionCreationValidationError(
                 f"Too many question options (got {value})."
             )
-        if len(value) < Settings.MIN_NUM_OPTIONS:
+        if num_options < Settings.MIN_NUM_OPTIONS:
             raise QuestionCreationValidationError(
                 f"Too few question options (got {value})."
             )
         # handle the case when question_options is a list of lists (a list of list can be converted to set)
         tmp_value = [str(x) for x in value]
-        if len(tmp_value) != len(set(tmp_value)):
+        if num_options != len(set(tmp_value)):
             raise QuestionCreationValidationError(
                 f"Question options must be unique (got {value})."
             )
         if not self.linear_scale:
             if not self.q_budget:
+                option_type = type(value[0])
                 if not (
-                    value
-                    and all(type(x) == type(value[0]) for x in value)
+                    all(type(x) is option_type for x in value)
                     and isinstance(value[0], (str, list, int, float))
                 ):
                     raise QuestionCreationValidationError(
                         f"Question options must be all same type (got {value}).)"
                     )
             else:
-                if not all(isinstance(x, (str)) for x in value):
+                if not all(type(x) is str for x in value):
                     raise QuestionCreationValidationError(
                         f"Question options must be strings (got {value}).)"
                     )
             if not all(
-                [
-                    type(option) != str
-                    or (len(option) >= 1 and len(option) < Settings.MAX_OPTION_LENGTH)
-                    for option in value
-                ]
+                type(option) is not str or 1 <= len(option) < Settings.MAX_OPTION_LENGTH
+                for option in value
             ):
                 raise QuestionCreationValidationError(
                     f"All question options must be at least 1 character long but less than {Settings.MAX_OPTION_LENGTH} characters long (got {value})."
                 )
 
         if hasattr(instance, "min_selections") and instance.min_selections != None:
-            if instance.min_selections > len(value):
+            if instance.min_selections > num_options:
                 raise QuestionCreationValidationError(
                     f"You asked for at least {instance.min_selections} selections, but provided fewer options (got {value})."
                 )
         if hasattr(instance, "max_selections") and instance.max_selections != None:
-            if instance.max_selections > len(value):
+            if instance.max_selections > num_options:
                 raise QuestionCreationValidationError(
                     f"You asked for at most {instance.max_selections} selections, but provided fewer options (got {value})."
                 )
         if self.num_choices is not None:
-            if len(value) != self.num_choices:
+            if num_options != self.num_choices:
                 raise QuestionCreationValidationError(
-                    f"You asked for {self.num_choices} selections, but provided {len(value)} options."
+                    f"You asked for {self.num_choices} selections, but provided {num_options} options."
                 )
         if self.linear_scale:
             if sorted(value) != list(range(min(value), max(value) + 1)):
@@ -26,7 +26,7 @@ class DatasetExportMixin:
         >>> from edsl.results import Results; Results.example().select('how_feeling', 'how_feeling_yesterday').relevant_columns()
         ['answer.how_feeling', 'answer.how_feeling_yesterday']
         """
-        columns = [list(x.keys())[0] for x in self]
+        columns = [next(iter(x)) for x in self]
         # columns = set([list(result.keys())[0] for result in self.data])
         if remove_prefix:
             columns = [column.split(".")[-1] for column in columns]
@@ -54,18 +54,13 @@ class DatasetExportMixin:
         d = {}
         full_header = sorted(list(self.relevant_columns()))
         for entry in self.data:
-            key, list_of_values = list(entry.items())[0]
-            d[key] = list_of_values
+            d.update(entry)
         if remove_prefix:
             header = [h.split(".")[-1] for h in full_header]
         else:
             header = full_header
-        num_observations = len(list(self[0].values())[0])
-        rows = []
-        # rows.append(header)
-        for i in range(num_observations):
-            row = [d[h][i] for h in full_header]
-            rows.append(row)
+        # transpose the columns into rows in one pass
+        rows = [list(row) for row in zip(*(d[h] for h in full_header))]
         if pretty_labels is not None:
             header = [pretty_labels.get(h, h) for h in header]
         return header, rows
@@ -1,6 +1,7 @@
 # """This module contains the Result class, which captures the result of one interview."""
 from __future__ import annotations
 from collections import UserDict
+from functools import cached_property
 from typing import Any, Type, Callable, Optional
 from collections import UserDict
 from edsl.Base import Base
@@ -175,15 +176,24 @@ class Result(Base, UserDict):
         """Return a string of code that can be used to recreate the Result object."""
         raise NotImplementedError
 
-    @property
+    @cached_property
     def combined_dict(self) -> dict[str, Any]:
-        """Return a dictionary that includes all sub_dicts, but also puts the key-value pairs in each sub_dict as a key_value pair in the combined dictionary."""
+        """Return a dictionary that includes all sub_dicts, but also puts the key-value pairs in each sub_dict as a key_value pair in the combined dictionary.
+
+        The dictionary is computed once and cached; call `_clear_cached_dicts`
+        after changing the result in place.
+        """
         combined = {}
         for key, sub_dict in self.sub_dicts.items():
             combined.update(sub_dict)
             combined.update({key: sub_dict})
         return combined
 
+    def _clear_cached_dicts(self) -> None:
+        """Drop the cached `combined_dict` and `key_to_data_type` so they are rebuilt on next access."""
+        self.__dict__.pop("combined_dict", None)
+        self.__dict__.pop("key_to_data_type", None)
+
     def get_value(self, data_type: str, key: str) -> Any:
         """Return the value for a given data type and key.
 
@@ -196,19 +206,20 @@ class Result(Base, UserDict):
         """
         return self.sub_dicts[data_type][key]
 
-    @property
+    @cached_property
     def key_to_data_type(self) -> dict[str, str]:
         """Return a dictionary where keys are object attributes and values are the data type (object) that the attribute is associated with.
 
+        Cached like `combined_dict`.
+
         >>> r = Result.example()
         >>> r.key_to_data_type["how_feeling"]
         'answer'
 
         """
         d = {}
-        data_types = self.sub_dicts.keys()
-        for data_type in data_types:
-            for key in self.sub_dicts[data_type]:
+        for data_type, sub_dict in self.sub_dicts.items():
+            for key in sub_dict:
                 d[key] = data_type
         return d
 
@@ -308,6 +319,9 @@ class Result(Base, UserDict):
 
         to_display = self.__dict__.copy()
         data = to_display.pop("data", None)
+        # cached views of the data, not attributes
+        to_display.pop("combined_dict", None)
+        to_display.pop("key_to_data_type", None)
         for attr_name, attr_value in to_display.items():
             if hasattr(attr_value, "rich_print"):
                 table.add_row(attr_name, attr_value.rich_print())
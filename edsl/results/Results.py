@@ -5,6 +5,7 @@ It is not typically instantiated directly, but is returned by the run method of
 
 from __future__ import annotations
 import json
+import operator
 import random
 from collections import UserList, defaultdict
 from typing import Optional, Callable, Any, Type, Union, List
@@ -79,6 +80,9 @@ class Results(UserList, Mixins, Base):
         "comment",
     ]
 
+    # export methods implemented here rather than on the Dataset from `select`
+    _not_converted_to_dataset = ("relevant_columns",)
+
     def __init__(
         self,
         survey: Optional["Survey"] = None,
@@ -168,7 +172,12 @@ class Results(UserList, Mixins, Base):
         )
 
     def __repr__(self) -> str:
-        return f"Results(data = {self.data}, survey = {repr(self.survey)}, created_columns = {self.created_columns})"
+        # only show the first few results; the full data is available via to_dict()
+        max_shown = 5
+        data = repr(self.data[:max_shown])
+        if len(self.data) > max_shown:
+            data = f"{data[:-1]}, ... (+{len(self.data) - max_shown} more)]"
+        return f"Results(data = {data}, survey = {repr(self.survey)}, created_columns = {self.created_columns})"
 
     def _repr_html_(self) -> str:
         from IPython.display import HTML
@@ -188,10 +197,7 @@ class Results(UserList, Mixins, Base):
     def _to_dict(self, sort=False):
         from edsl.data.Cache import Cache
 
-        if sort:
-            data = sorted([result for result in self.data], key=lambda x: hash(x))
-        else:
-            data = [result for result in self.data]
+        data = sorted(self.data, key=hash) if sort else self.data
         return {
             "data": [result.to_dict() for result in data],
             "survey": self.survey.to_dict(),
@@ -297,6 +303,43 @@ class Results(UserList, Mixins, Base):
     ## Convenience methods
     ## & Report methods
     ######################
+    def _key_mappings(self) -> tuple[dict[str, str], dict[str, set]]:
+        """
+        Return the `_key_to_data_type` and `_data_type_to_keys` mappings.
+
+        Both are built in one pass over the data and reused until the created
+        columns or any result's `key_to_data_type` change. Each Result caches its
+        own `key_to_data_type` until it is changed in place (see
+        `Result._clear_cached_dicts`), so this also notices changes made through
+        other Results that share the same Result objects.
+        """
+        result_keys = [result.key_to_data_type for result in self.data]
+        cached = self.__dict__.get("_cached_key_mappings")
+        if (
+            cached is not None
+            and cached[0] == self.created_columns
+            and len(cached[1]) == len(result_keys)
+            and all(map(operator.is_, cached[1], result_keys))
+        ):
+            return cached[2], cached[3]
+
+        key_to_data_type = {}
+        data_type_to_keys = defaultdict(set)
+        for keys in result_keys:
+            for key, value in keys.items():
+                key_to_data_type[key] = value
+                data_type_to_keys[value].add(key)
+        for column in self.created_columns:
+            key_to_data_type[column] = "answer"
+            data_type_to_keys["answer"].add(column)
+        self._cached_key_mappings = (
+            list(self.created_columns),
+            result_keys,
+            key_to_data_type,
+            data_type_to_keys,
+        )
+        return key_to_data_type, data_type_to_keys
+
     @property
     def _key_to_data_type(self) -> dict[str, str]:
         """
@@ -306,12 +349,7 @@ class Results(UserList, Mixins, Base):
         - Uses the key_to_data_type property of the Result class.
         - Includes any columns that the user has created with `mutate`
         """
-        d = {}
-        for result in self.data:
-            d.update(result.key_to_data_type)
-        for column in self.created_columns:
-            d[column] = "answer"
-        return d
+        return self._key_mappings()[0]
 
     @property
     def _data_type_to_keys(self) -> dict[str, str]:
@@ -326,13 +364,35 @@ class Results(UserList, Mixins, Base):
         >>> r._data_type_to_keys
         defaultdict(...
         """
-        d: dict = defaultdict(set)
-        for result in self.data:
-            for key, value in result.key_to_data_type.items():
-                d[value] = d[value].union(set({key}))
-        for column in self.created_columns:
-            d["answer"] = d["answer"].union(set({column}))
-        return d
+        return self._key_mappings()[1]
+
+    def relevant_columns(
+        self, data_type: Optional[str] = None, remove_prefix=False
+    ) -> list:
+        """Return the columns in the Results, in the order `select` returns them.
+
+        Reads the cached key mappings instead of selecting all of the data.
+
+        >>> r = Results.example()
+        >>> r.relevant_columns(data_type="scenario")
+        ['scenario.period']
+        >>> sorted(r.relevant_columns()) == r.columns
+        True
+        """
+        columns = [
+            known_data_type + "." + key
+            for known_data_type in self.known_data_types
+            for key in self._data_type_to_keys[known_data_type]
+        ]
+        if remove_prefix:
+            columns = [column.split(".")[-1] for column in columns]
+
+        if data_type:
+            columns = [
+                column for column in columns if column.split(".")[0] == data_type
+            ]
+
+        return columns
 
     @property
     def columns(self) -> list[str]:
@@ -363,14 +423,9 @@ class Results(UserList, Mixins, Base):
             raise Exception("Survey is not defined so no answer keys are available.")
 
         answer_keys = self._data_type_to_keys["answer"]
-        answer_keys = {k for k in answer_keys if "_comment" not in k}
-        questions_text = [
-            self.survey.get_question(k).question_text for k in answer_keys
-        ]
-        short_question_text = [shorten_string(q, 80) for q in questions_text]
-        initial_dict = dict(zip(answer_keys, short_question_text))
-        sorted_dict = {key: initial_dict[key] for key in sorted(initial_dict)}
-        return sorted_dict
+        answer_keys = sorted(k for k in answer_keys if "_comment" not in k)
+        questions = self.survey.question_names_to_questions()
+        return {k: shorten_string(questions[k].question_text, 80) for k in answer_keys}
 
     @property
     def agents(self) -> "AgentList":
@@ -561,6 +616,7 @@ class Results(UserList, Mixins, Base):
             value = new_result.get_value("answer", column)
             # breakpoint()
             new_result["answer"][new_var_name] = recode_function(value)
+            new_result._clear_cached_dicts()
             new_data.append(new_result)
 
         # print("Created new variable", new_var_name)
@@ -584,6 +640,7 @@ class Results(UserList, Mixins, Base):
         new_results = self.data.copy()
         for i, result in enumerate(new_results):
             result["answer"][column_name] = values[i]
+            result._clear_cached_dicts()
         return Results(
             survey=self.survey,
             data=new_results,
@@ -632,22 +689,21 @@ class Results(UserList, Mixins, Base):
         if not is_valid_variable_name(var_name):
             raise ResultsInvalidNameError(f"{var_name} is not a valid variable name.")
 
-        # create the evaluator
+        # create the evaluator; the expression is parsed once and only the names
+        # change from one result to the next
         functions_dict = functions_dict or {}
-
-        def create_evaluator(result: Result) -> EvalWithCompoundTypes:
-            return EvalWithCompoundTypes(
-                names=result.combined_dict, functions=functions_dict
-            )
+        evaluator = EvalWithCompoundTypes(functions=functions_dict)
 
         def new_result(old_result: "Result", var_name: str) -> "Result":
-            evaluator = create_evaluator(old_result)
-            value = evaluator.eval(expression)
+            evaluator.names = old_result.combined_dict
+            value = evaluator.eval(expression, previously_parsed=parsed_expression)
             new_result = old_result.copy()
             new_result["answer"][var_name] = value
+            new_result._clear_cached_dicts()
             return new_result
 
         try:
+            parsed_expression = evaluator.parse(expression)
             new_data = [new_result(result, var_name) for result in self.data]
         except Exception as e:
             raise ResultsMutateError(f"Error in mutate. Exception:{e}")
@@ -672,6 +728,7 @@ class Results(UserList, Mixins, Base):
         for obs in self.data:
             obs["answer"][new_name] = obs["answer"][old_name]
             del obs["answer"][old_name]
+            obs._clear_cached_dicts()
 
         return self
 
@@ -762,16 +819,20 @@ class Results(UserList, Mixins, Base):
                     )
                 return [parsed_data_type]
 
-        # we're doing to populate this with the data we want to fetch
-        to_fetch = defaultdict(list)
-
-        new_data = []
-        items_in_order = []
+        # (data_type, key) pairs to fetch, in the order they were asked for
+        columns_to_fetch = []
         # iterate through the passed columns
         for column in columns:
             # a user could pass 'result.how_feeling' or just 'how_feeling'
             parsed_data_type, parsed_key = self._parse_column(column)
             data_types = get_data_types_to_return(parsed_data_type)
+            if parsed_data_type != "*" and parsed_key != "*":
+                # a fully qualified column: no need to scan every key
+                if parsed_key not in self._data_type_to_keys[parsed_data_type]:
+                    raise Exception(f"Key {parsed_key} not found in data.")
+                columns_to_fetch.append((parsed_data_type, parsed_key))
+                continue
+
             found_once = False  # we need to track this to make sure we found the key at least once
 
             for data_type in data_types:
@@ -781,24 +842,17 @@ class Results(UserList, Mixins, Base):
                 for key in relevant_keys:
                     if key == parsed_key or parsed_key == "*":
                         found_once = True
-                        to_fetch[data_type].append(key)
-                        items_in_order.append(data_type + "." + key)
+                        columns_to_fetch.append((data_type, key))
 
             if not found_once:
                 raise Exception(f"Key {parsed_key} not found in data.")
 
-        for data_type in to_fetch:
-            for key in to_fetch[data_type]:
-                entries = self._fetch_list(data_type, key)
-                new_data.append({data_type + "." + key: entries})
-
-        def sort_by_key_order(dictionary):
-            # Extract the single key from the dictionary
-            single_key = next(iter(dictionary))
-            # Return the index of this key in the list_of_keys
-            return items_in_order.index(single_key)
-
-        sorted(new_data, key=sort_by_key_order)
+        new_data = [
+            {data_type + "." + key: entries}
+            for (data_type, key), entries in zip(
+                columns_to_fetch, self._fetch_lists(columns_to_fetch)
+            )
+        ]
         from edsl.results.Dataset import Dataset
 
         return Dataset(new_data)
@@ -856,15 +910,17 @@ class Results(UserList, Mixins, Base):
             except:
                 return v
 
-        def sort_key(item):
-            key_components = []
-            for col in columns:
-                data_type, key = self._parse_column(col)
-                value = item.get_value(data_type, key)
-                key_components.append(to_numeric_if_possible(value))
-            return tuple(key_components)
-
-        new_data = sorted(self.data, key=sort_key, reverse=reverse)
+        # fetch and convert the sort keys once, in a single pass over the data
+        parsed_columns = [self._parse_column(col) for col in columns]
+        converted_columns = [
+            [to_numeric_if_possible(value) for value in values]
+            for values in self._fetch_lists(parsed_columns)
+        ]
+        sort_keys = list(zip(*converted_columns)) or [()] * len(self.data)
+        order = sorted(
+            range(len(self.data)), key=sort_keys.__getitem__, reverse=reverse
+        )
+        new_data = [self.data[i] for i in order]
         return Results(survey=self.survey, data=new_data, created_columns=None)
 
     def filter(self, expression: str) -> Results:
@@ -916,19 +972,23 @@ class Results(UserList, Mixins, Base):
                 "You must use '==' instead of '=' in the filter expression."
             )
 
-        def create_evaluator(result):
-            """Create an evaluator for the given result.
+        evaluator = EvalWithCompoundTypes()
+
+        def matches(result) -> bool:
+            """Evaluate the expression for the given result.
             The 'combined_dict' is a mapping of all values for that Result object.
             """
-            return EvalWithCompoundTypes(names=result.combined_dict)
+            evaluator.names = result.combined_dict
+            return evaluator.eval(expression, previously_parsed=parsed_expression)
 
         try:
-            # iterates through all the results and evaluates the expression
-            new_data = [
-                result
-                for result in self.data
-                if create_evaluator(result).eval(expression)
-            ]
+            # parses the expression once, then evaluates it for each of the results
+            parsed_expression = evaluator.parse(expression)
+            mask = self._filter_mask(parsed_expression)
+            if mask is not None:
+                new_data = [result for result, keep in zip(self.data, mask) if keep]
+            else:
+                new_data = [result for result in self.data if matches(result)]
         except Exception as e:
             raise ResultsFilterError(
                 f"""Error in filter. Exception:{e}.
@@ -948,6 +1008,83 @@ class Results(UserList, Mixins, Base):
 
         return Results(survey=self.survey, data=new_data, created_columns=None)
 
+    def _filter_mask(self, parsed_expression) -> Optional["np.ndarray"]:
+        """Evaluate simple filter expressions column-wise with NumPy.
+
+        Handles comparisons of a column with a constant, combined with `and`/`or`.
+        Returns None for any other expression, which `filter` then evaluates
+        result by result.
+
+        >>> r = Results.example()
+        >>> r._filter_mask(EvalWithCompoundTypes.parse("how_feeling == 'Great' or period == 'morning'"))
+        array([ True,  True,  True, False])
+        >>> r._filter_mask(EvalWithCompoundTypes.parse("how_feeling.startswith('G')")) is None
+        True
+        """
+        import ast
+        import operator
+        from functools import reduce
+
+        import numpy as np
+
+        comparison_operators = {
+            ast.Eq: operator.eq,
+            ast.NotEq: operator.ne,
+            ast.Lt: operator.lt,
+            ast.LtE: operator.le,
+            ast.Gt: operator.gt,
+            ast.GtE: operator.ge,
+        }
+        columns = {}
+
+        def column_values(name: str) -> Optional[np.ndarray]:
+            # names of whole data types (e.g., 'agent') evaluate to dictionaries
+            if name in self.known_data_types:
+                return None
+            if name not in columns:
+                values = np.empty(len(self.data), dtype=object)
+                # the same (cached) names the row-wise evaluator would see
+                for i, result in enumerate(self.data):
+                    names = result.combined_dict
+                    if name not in names:
+                        return None
+                    values[i] = names[name]
+                columns[name] = values
+            return columns[name]
+
+        def mask(node) -> Optional[np.ndarray]:
+            if isinstance(node, ast.Expr):
+                return mask(node.value)
+            if isinstance(node, ast.BoolOp):
+                masks = [mask(value) for value in node.values]
+                if any(m is None for m in masks):
+                    return None
+                combine = (
+                    np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+                )
+                return reduce(combine, masks)
+            if (
+                isinstance(node, ast.Compare)
+                and len(node.ops) == 1
+                and type(node.ops[0]) in comparison_operators
+                and isinstance(node.left, ast.Name)
+                and isinstance(node.comparators[0], ast.Constant)
+            ):
+                values = column_values(node.left.id)
+                if values is None:
+                    return None
+                compare = comparison_operators[type(node.ops[0])]
+                return np.asarray(
+                    compare(values, node.comparators[0].value), dtype=bool
+                )
+            return None
+
+        try:
+            return mask(parsed_expression)
+        except Exception:
+            # e.g., values that can't be compared; the row-wise path reports the error
+            return None
+
     @classmethod
     def example(cls, debug: bool = False, randomize: bool = False) -> Results:
         """Return an example `Results` object.
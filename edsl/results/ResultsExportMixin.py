@@ -23,6 +23,9 @@ def to_dataset(func):
 
 def decorate_methods_from_mixin(cls, mixin_cls):
     for attr_name, attr_value in mixin_cls.__dict__.items():
+        if attr_name in getattr(cls, "_not_converted_to_dataset", ()):
+            # the class implements these itself without building a Dataset
+            continue
         if callable(attr_value) and not attr_name.startswith("__"):
             setattr(cls, attr_name, to_dataset(attr_value))
     return cls
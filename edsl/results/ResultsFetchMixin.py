@@ -20,11 +20,28 @@ class ResultsFetchMixin:
         >>> r._fetch_list('answer', 'how_feeling')
         ['OK', 'Great', 'Terrible', 'OK']
         """
-        returned_list = []
-        for row in self.data:
-            returned_list.append(row.sub_dicts[data_type].get(key, None))
+        return self._fetch_lists([(data_type, key)])[0]
+
+    def _fetch_lists(self, columns: list[tuple[str, str]]) -> list[list]:
+        """
+        Return a list of values for each of the given (data type, key) columns.
+
+        Builds all of the columns in a single pass over the data, so each row's
+        `sub_dicts` are only computed once no matter how many columns are fetched.
+
+        Example:
 
-        return returned_list
+        >>> from edsl.results import Results
+        >>> r = Results.example()
+        >>> r._fetch_lists([('answer', 'how_feeling'), ('scenario', 'period')])
+        [['OK', 'Great', 'Terrible', 'OK'], ['morning', 'afternoon', 'morning', 'afternoon']]
+        """
+        columns_values = [[] for _ in columns]
+        for row in self.data:
+            sub_dicts = row.sub_dicts
+            for (data_type, key), values in zip(columns, columns_values):
+                values.append(sub_dicts[data_type].get(key, None))
+        return columns_values
 
 
 if __name__ == "__main__":
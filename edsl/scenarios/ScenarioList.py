@@ -375,12 +375,10 @@ class ScenarioList(Base, UserList, ScenarioListMixin):
         """
         from edsl.scenarios.Scenario import Scenario
 
-        observations = []
-        with open(filename, "r") as f:
+        with open(filename, "r", newline="") as f:
             reader = csv.reader(f)
             header = next(reader)
-            for row in reader:
-                observations.append(Scenario(dict(zip(header, row))))
+            observations = [Scenario(dict(zip(header, row))) for row in reader]
         return cls(observations)
 
     def _to_dict(self, sort=False) -> dict:
@@ -1,6 +1,7 @@
 """Utility functions for working with strings, dictionaries, and files."""
 
 from functools import wraps
+from itertools import count
 import types
 import time
 
@@ -196,6 +197,28 @@ def random_string() -> str:
     return "".join(random.choice(string.ascii_letters) for i in range(10))
 
 
+RANDOM_STRING_POOL_SIZE = 256
+_random_string_pool = []
+_random_string_counter = count()
+
+
+def pooled_random_string() -> str:
+    """Return a random string from a pool that is generated on first use.
+
+    Cheaper than `random_string` when many strings are needed, e.g., for simulated
+    answers. Strings repeat every `RANDOM_STRING_POOL_SIZE` calls, so use
+    `random_string` where they must be unique.
+
+    >>> pooled_random_string() != pooled_random_string()
+    True
+    """
+    if not _random_string_pool:
+        _random_string_pool.extend(
+            random_string() for _ in range(RANDOM_STRING_POOL_SIZE)
+        )
+    return _random_string_pool[next(_random_string_counter) % RANDOM_STRING_POOL_SIZE]
+
+
 def shortname_proposal(question, max_length=None):
     """Take a question text and generate a slug."""
     question = question.lower()
@@ -115,3 +115,31 @@ for child_class_name, child_class in RegisterSubclassesMeta._registry.items():
     base_test_method_name = f"test_file_operations_{child_class_name}"
     base_test_method = create_file_operations_test(child_class)
     setattr(TestBaseModels, base_test_method_name, base_test_method)
+
+
+def test_save_load_keeps_large_integers(tmp_path):
+    from edsl import Scenario
+
+    s = Scenario({"y": 2**70 + 1})
+    s.save(str(tmp_path / "s"))
+    assert Scenario.load(str(tmp_path / "s.json.gz"))["y"] == 2**70 + 1
+
+
+def test_save_load_keeps_non_finite_floats(tmp_path):
+    import math
+    from edsl import Scenario
+
+    s = Scenario({"x": float("nan"), "z": float("inf"), "w": -float("inf")})
+    s.save(str(tmp_path / "s"))
+    loaded = Scenario.load(str(tmp_path / "s.json.gz"))
+    assert math.isnan(loaded["x"])
+    assert loaded["z"] == float("inf")
+    assert loaded["w"] == -float("inf")
+
+
+def test_save_load_keeps_large_negative_integers(tmp_path):
+    from edsl import Scenario
+
+    s = Scenario({"y": -(2**63) - 1})
+    s.save(str(tmp_path / "s"))
+    assert Scenario.load(str(tmp_path / "s.json.gz"))["y"] == -(2**63) - 1
@@ -113,6 +113,14 @@ def test_QuestionFreeText_answers():
     assert q._translate_answer_code_to_answer(response_good, None) == response_good
 
 
+def test_QuestionFreeText_validate_answers():
+    q = QuestionFreeText(**valid_question)
+    answers = [{"answer": "ok"}, {"answer": "fine", "comment": "OK"}]
+    assert q._validate_answers(answers) == answers
+    with pytest.raises(QuestionAnswerValidationError):
+        q._validate_answers([{"answer": "ok"}, {"you": "suck"}])
+
+
 def test_test_QuestionFreeText_extras():
     """Test QuestionFreeText extra functionalities."""
     q = QuestionFreeText(**valid_question)
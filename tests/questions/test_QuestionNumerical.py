@@ -145,6 +145,7 @@ def test_QuestionNumerical_answers():
     q._validate_answer(response_good)
     q._validate_answer({"answer": "5"})
     q._validate_answer({"answer": "5.555"})
+    assert q._validate_answer({"answer": "5.5"}) == {"answer": 5.5}
     with pytest.raises(QuestionAnswerValidationError):
         q._validate_answer(response_terrible)
 
@@ -176,6 +177,41 @@ def test_QuestionNumerical_answers():
     assert q._translate_answer_code_to_answer(response_good, None) == response_good
 
 
+def test_QuestionNumerical_answers_revalidated_after_change():
+    q = QuestionNumerical(**valid_question)
+    q._validate_answer({"answer": 5})
+    q._validate_answer({"answer": 5})
+    # accepted answers are remembered, but not serialized
+    assert q.data == valid_question
+    # changing the question invalidates previously accepted answers
+    q.max_value = 4
+    with pytest.raises(QuestionAnswerValidationError):
+        q._validate_answer({"answer": 5})
+
+
+def test_QuestionNumerical_validate_answers():
+    q = QuestionNumerical(**valid_question)
+    answers = [{"answer": 1}, {"answer": "5.5"}, {"answer": 10}]
+    assert q._validate_answers(answers) == [
+        {"answer": 1},
+        {"answer": 5.5},
+        {"answer": 10},
+    ]
+    with pytest.raises(QuestionAnswerValidationError, match="greater than"):
+        q._validate_answers([{"answer": 5}, {"answer": 11}])
+    with pytest.raises(QuestionAnswerValidationError):
+        q._validate_answers([{"answer": 5}, {"answer": "Albuquerque"}])
+    with pytest.raises(QuestionAnswerValidationError, match="greater than"):
+        q._validate_answers([{"answer": 5}, {"answer": 10**400}])
+    with pytest.raises(QuestionAnswerValidationError, match="greater than"):
+        q._validate_answers([{"answer": 5}, {"answer": "1" * 400}])
+    q = QuestionNumerical(question_name="big", question_text="How many?")
+    assert q._validate_answers([{"answer": 5}, {"answer": 10**400}]) == [
+        {"answer": 5},
+        {"answer": 10**400},
+    ]
+
+
 def test_test_QuestionNumerical_extras():
     """Test QuestionNumerical extra functionalities."""
     q = QuestionNumerical(**valid_question)
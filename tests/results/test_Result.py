@@ -47,3 +47,13 @@ def test_constructor():
         "agent_name": "Arsenio Billingham",
         "show_status": "off the air",
     }.items() <= result.sub_dicts["agent"].items()
+
+
+def test_rich_print_skips_cached_dicts():
+    result = Result.example()
+    result.combined_dict
+    result.key_to_data_type
+    attributes = result.rich_print().columns[0]._cells
+    assert "combined_dict" not in attributes
+    assert "key_to_data_type" not in attributes
+    assert "answer" in attributes
@@ -85,6 +85,51 @@ class TestResults(unittest.TestCase):
     def test_relevant_columns(self):
         self.assertIn("answer.how_feeling", self.example_results.relevant_columns())
 
+    def test_columns_after_in_place_changes(self):
+        r = Results.example(debug=True)
+        self.assertIn("answer.how_feeling", r.columns)
+        r.rename("how_feeling", "how_feeling_new")
+        self.assertIn("answer.how_feeling_new", r.columns)
+        self.assertNotIn("answer.how_feeling", r.columns)
+
+    def test_filter_after_in_place_changes(self):
+        r = Results.example(debug=True)
+        n = len(r.filter("how_feeling == 'OK'"))
+        r.rename("how_feeling", "how_feeling_new")
+        self.assertEqual(len(r.filter("how_feeling_new == 'OK'")), n)
+        with self.assertRaises(Exception):
+            r.filter("how_feeling == 'OK'")
+
+    def test_select_after_in_place_changes(self):
+        r = Results.example(debug=True)
+        before = r.select("how_feeling").to_list()
+        r.rename("how_feeling", "how_feeling_new")
+        self.assertEqual(r.select("how_feeling_new").to_list(), before)
+        r.add_column("a", [1, 2, 3, 4])
+        self.assertEqual(r.select("a").to_list(), [1, 2, 3, 4])
+
+    def test_select_after_renaming_in_shared_results(self):
+        r = Results.example(debug=True)
+        r2 = r.filter("how_feeling == how_feeling")
+        values = r2.select("how_feeling").to_list()
+        r.rename("how_feeling", "hf")
+        self.assertEqual(r2.select("hf").to_list(), values)
+        with self.assertRaises(Exception):
+            r2.select("how_feeling")
+
+    def test_select_after_reordering_in_place(self):
+        r = Results.example(debug=True)
+        values = r.select("how_feeling").to_list()
+        r.reverse()
+        self.assertEqual(r.select("how_feeling").to_list(), values[::-1])
+        r[0] = r[-1]
+        self.assertEqual(r.select("how_feeling").to_list()[0], values[0])
+
+    def test_repr_truncates_long_results(self):
+        r = self.example_results + self.example_results
+        self.assertIn("... (+3 more)]", repr(r))
+        self.assertNotIn("more)", repr(self.example_results))
+
     def test_answer_keys(self):
         self.assertIn("how_feeling", self.example_results.answer_keys.keys())
 